@@ -2,10 +2,12 @@
 Shared test helpers for documentation code examples.
 
 Centralizes the private `_Galtea__client` workaround for API calls that the
-SDK does not yet expose publicly. When the SDK adds these methods, update
-only this file.
+SDK does not yet expose publicly, plus setup utilities shared by several
+examples. When the SDK adds these methods, update only this file.
 """
 
+import time
+
 from galtea import Galtea
 
 
@@ -58,3 +60,45 @@ def list_users(galtea: Galtea, organization_id: str, limit: int = 1) -> list[dic
         "users", params={"organizationIds": organization_id, "limit": limit}
     )
     return response.json()
+
+
+def wait_for_tests_ready(
+    galtea: Galtea,
+    test_ids: list[str],
+    *,
+    require_test_cases: bool = False,
+    timeout: float = 120,
+) -> dict:
+    """Wait until every test has its file ready and return them by ID.
+
+    All pending tests are checked with a single ``tests.list()`` call per
+    round, so waiting on several generated tests costs the slowest one
+    rather than the sum of them. The poll interval starts short and backs
+    off to at most 5 seconds. With ``require_test_cases``, a test is only
+    considered ready once at least one of its test cases is listed.
+    """
+    ready = {}
+    pending = list(dict.fromkeys(test_ids))
+    delay = 0.5
+    deadline = time.monotonic() + timeout
+    while pending:
+        for test in galtea.tests.list(id=pending, limit=len(pending)):
+            if not test.uri:
+                continue
+            if require_test_cases and not galtea.test_cases.list(
+                test_id=test.id, limit=1
+            ):
+                continue
+            ready[test.id] = test
+        pending = [test_id for test_id in pending if test_id not in ready]
+        if not pending:
+            break
+        if time.monotonic() >= deadline:
+            raise ValueError(
+                "Tests are still not ready after waiting. Test ids: "
+                + ", ".join(pending)
+            )
+        print(f"Waiting for {len(pending)} test(s) to be ready...")
+        time.sleep(delay)
+        delay = min(delay * 2, 5)
+    return ready
@@ -1,7 +1,12 @@
+import csv
+import itertools
+import tempfile
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from pathlib import Path
 
-from _test_helpers import create_test_product
+from _test_helpers import create_test_product, wait_for_tests_ready
 from requests.exceptions import HTTPError
 
 from galtea import (
@@ -135,6 +140,43 @@ if test_case is None:
 
 test_case_id = test_case.id
 
+# @start test_case_create_many
+# Create test cases from any iterable (e.g. a generator over your corpus),
+# a chunk at a time so the full set never has to be held in memory
+def create_test_cases(test_id: str, cases, chunk_size: int = 100, max_workers: int = 8):
+    def create_one(case):
+        try:
+            return galtea.test_cases.create(test_id=test_id, **case)
+        except Exception as e:
+            return e
+
+    created, errors = 0, []
+    rows = enumerate(cases)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            results = executor.map(create_one, [case for _, case in chunk])
+            for (row, _), result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    errors.append((row, result))  # Keep going, report the row
+                else:
+                    created += 1
+    return created, errors
+
+
+corpus = (
+    {
+        "input": f"What is {n} + {n}?",
+        "expected_output": str(2 * n),
+        "variant": "original",
+    }
+    for n in range(20)
+)
+created, errors = create_test_cases(test_id, corpus)
+print(f"Created {created} test cases, {len(errors)} failed")
+for row, error in errors:
+    print(f"  Row {row}: {error}")
+# @end test_case_create_many
+
 # @start test_case_list
 test_cases = galtea.test_cases.list(test_id=test_id, limit=20)
 # @end test_case_list
@@ -396,6 +438,59 @@ galtea.traces.create_batch(
 )
 # @end trace_create_batch
 
+# @start trace_create_batch_backfill
+# Upload traces from any iterable (e.g. spans replayed from logs) in chunks,
+# a few chunks at a time, retrying each failed chunk on its own
+def upload_traces(
+    traces, chunk_size: int = 500, max_workers: int = 4, max_retries: int = 3
+):
+    def upload_chunk(chunk):
+        for attempt in range(max_retries):
+            try:
+                return galtea.traces.create_batch(chunk)
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    return e
+                time.sleep(2**attempt)
+
+    created, failed = 0, []
+    in_flight = {}
+
+    def collect(futures):
+        nonlocal created
+        for future in futures:
+            chunk, result = in_flight.pop(future), future.result()
+            if isinstance(result, Exception):
+                failed.append((chunk, result))  # Keep the chunk to retry later
+            else:
+                created += len(result or [])
+
+    iterator = iter(traces)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            # Submit a new chunk as soon as any upload finishes, so a slow or
+            # retrying chunk never holds the others back. At most max_workers
+            # chunks are held in memory at a time
+            if len(in_flight) >= max_workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight[executor.submit(upload_chunk, chunk)] = chunk
+        collect(list(in_flight))
+    return created, failed
+
+
+replayed_spans = (
+    TraceBase(
+        inference_result_id=inference_result_id,
+        name=f"replayed_span_{n}",
+        type=TraceType.SPAN,
+    )
+    for n in range(1_000)
+)
+created, failed = upload_traces(replayed_spans)
+print(f"Uploaded {created} traces, {len(failed)} chunks failed")
+# @end trace_create_batch_backfill
+
 # @start trace_list
 traces = galtea.traces.list(inference_result_id=inference_result_id)
 # @end trace_list
@@ -622,8 +717,14 @@ else:
     print("No scores available yet")
 
 print("Detailed Results:")
+# Fetch all the metrics used by these evaluations in a single request
+metric_ids = list({evaluation.metric_id for evaluation in evaluations})
+metrics_by_id = {
+    metric.id: metric
+    for metric in galtea.metrics.list(id=metric_ids, include_legacy=True)
+}
 for evaluation in evaluations:
-    metric = galtea.metrics.get(metric_id=evaluation.metric_id)
+    metric = metrics_by_id.get(evaluation.metric_id)
     print(f"Metric: {metric}")
     print(f"    Score: {evaluation.score}")
     print(f"    Reason: {evaluation.reason}")
@@ -637,16 +738,7 @@ if evaluation is None:
 
 
 # Check if test has finished generating before downloading, if not, await
-
-max_wait_iterations = 120  # e.g., wait up to 2 minutes
-for _ in range(max_wait_iterations):
-    test = galtea.tests.get(test_id=test.id)
-    if test.uri:
-        break
-    print("Waiting for test file to be ready...")
-    time.sleep(1)
-else:
-    raise ValueError("Test file URI is still None after waiting. Test id: " + test.id)
+test = wait_for_tests_ready(galtea, [test.id])[test.id]
 
 # @start test_download
 downloaded_path = galtea.tests.download(test=test, output_directory="./.temp")
@@ -654,6 +746,32 @@ downloaded_path = galtea.tests.download(test=test, output_directory="./.temp")
 if downloaded_path is None:
     raise ValueError("downloaded_path from download is None")
 
+# @start test_download_cached
+# A test's file never changes after creation, so it only needs downloading once
+def download_once(test, cache_directory: str = "./.temp") -> Path:
+    test_directory = Path(cache_directory) / test.id
+    if test_directory.exists() and (cached := next(test_directory.iterdir(), None)):
+        return cached
+    test_directory.mkdir(parents=True, exist_ok=True)
+    # Download into a scratch directory first so an interrupted download never
+    # leaves a partial file behind in the cache
+    with tempfile.TemporaryDirectory(dir=cache_directory) as scratch_directory:
+        downloaded = Path(
+            galtea.tests.download(test=test, output_directory=scratch_directory)
+        )
+        return downloaded.replace(test_directory / downloaded.name)
+
+
+def iter_test_rows(path: Path):
+    """Yield the rows of a downloaded test file one at a time."""
+    with open(path, newline="", encoding="utf-8") as file:
+        yield from csv.DictReader(file)
+
+
+for row in iter_test_rows(download_once(test)):
+    print(row)
+# @end test_download_cached
+
 # =============================================================================
 # CLEANUP RESOURCES in reverse order
 # =============================================================================
@@ -1,8 +1,8 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
-from _test_helpers import create_test_product
+from _test_helpers import create_test_product, wait_for_tests_ready
 from galtea import Galtea
 
 galtea = Galtea(api_key="YOUR_API_KEY")
@@ -46,18 +46,8 @@ _test = galtea.tests.create(
     strategies=["written"],
     specification_id=_spec.id,
 )
-for _ in range(120):
-    _t = galtea.tests.get(test_id=_test.id)
-    if _t.uri:
-        break
-    print("Waiting for test file to be ready...")
-    time.sleep(1)
-for _ in range(120):
-    _test_cases = galtea.test_cases.list(test_id=_test.id)
-    if len(_test_cases) > 0:
-        break
-    print("Waiting for test cases to be generated...")
-    time.sleep(1)
+wait_for_tests_ready(galtea, [_test.id], require_test_cases=True)
+test_id = _test.id
 
 specification_ids = [_spec.id]
 
@@ -105,5 +95,32 @@ print(f"Processed {result['testCaseCount']} test cases")
 print(f"Created {len(result['evaluations'])} evaluations")
 # @end run_with_agent
 
+# @start run_with_agent_concurrently
+# Run a local agent over many test cases concurrently (I/O-bound agents)
+def evaluate_test_case(test_case):
+    try:
+        session = galtea.sessions.create(
+            version_id=version_id, test_case_id=test_case.id
+        )
+        # Behavior test cases are multi-turn conversations driven by the
+        # simulator; for Accuracy test cases use inference_results.generate()
+        galtea.simulator.simulate(session_id=session.id, agent=my_agent, max_turns=10)
+        return galtea.evaluations.create(
+            session_id=session.id, specification_ids=specification_ids[:1]
+        )
+    except Exception as e:
+        # A failing test case doesn't stop the rest of the run
+        return e
+
+
+test_cases = galtea.test_cases.list(test_id=test_id)
+with ThreadPoolExecutor(max_workers=8) as executor:
+    # map() returns results in the same order as test_cases
+    results = list(executor.map(evaluate_test_case, test_cases))
+
+failed = [r for r in results if isinstance(r, Exception)]
+print(f"Evaluated {len(results) - len(failed)} test cases, {len(failed)} failed")
+# @end run_with_agent_concurrently
+
 # Cleanup
 galtea.products.delete(product_id=product_id)
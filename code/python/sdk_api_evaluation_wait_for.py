@@ -1,4 +1,5 @@
 
+import time
 from datetime import datetime
 
 import requests
@@ -57,6 +58,36 @@ completed = galtea.evaluations.wait_for(
 )
 # @end wait_for_custom_timeout
 
+# @start wait_for_as_completed
+# Yield evaluations as soon as they complete, checking pending ones in batches
+def iter_completed(
+    evaluation_ids: list[str], timeout: float = 300, chunk_size: int = 100
+):
+    pending = set(evaluation_ids)
+    delay = 1.0
+    deadline = time.monotonic() + timeout
+    while pending:
+        pending_ids = list(pending)
+        for start in range(0, len(pending_ids), chunk_size):
+            for evaluation in galtea.evaluations.list(
+                id=pending_ids[start : start + chunk_size],
+                status=["SUCCESS", "FAILED", "SKIPPED", "PENDING_HUMAN"],
+            ):
+                pending.discard(evaluation.id)
+                yield evaluation
+        if not pending:
+            break
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{len(pending)} evaluations still pending")
+        time.sleep(delay)
+        delay = min(delay * 2, 10)  # Back off while evaluations are still running
+
+
+for evaluation in iter_completed([e.id for e in evaluations]):
+    # Start downstream work on each evaluation as soon as it finishes
+    print(f"{evaluation.id}: {evaluation.status} — score: {evaluation.score}")
+# @end wait_for_as_completed
+
 specification = galtea.specifications.create(
     product_id,
     "The user should always salute the user with a greeting before providing an answer.",
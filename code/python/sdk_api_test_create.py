@@ -1,6 +1,11 @@
+import csv
+import itertools
+import tempfile
 from datetime import datetime
+from pathlib import Path
 
 from galtea import Galtea
+from requests.exceptions import HTTPError
 
 from _test_helpers import create_test_product
 
@@ -64,5 +69,53 @@ csv_test = galtea.tests.create(
 # @end quality_custom_test_from_csv
 print(f"Created CSV accuracy test: {csv_test.id}")
 
+
+# @start large_test_file_in_parts
+def iter_csv_parts(path: str, rows_per_part: int, output_dir: str):
+    """Split a CSV into smaller files without loading it into memory."""
+    with open(path, newline="", encoding="utf-8") as source:
+        reader = csv.reader(source)
+        header = next(reader)
+        for part_number in itertools.count(1):
+            rows = list(itertools.islice(reader, rows_per_part))
+            if not rows:
+                return
+            part_path = Path(output_dir) / f"part-{part_number:04d}.csv"
+            with open(part_path, "w", newline="", encoding="utf-8") as part:
+                writer = csv.writer(part)
+                writer.writerow(header)
+                writer.writerows(rows)
+            yield part_number, part_path
+
+
+def part_exists(part_name: str) -> bool:
+    try:
+        return (
+            galtea.tests.get_by_name(product_id=product_id, test_name=part_name)
+            is not None
+        )
+    except HTTPError as e:
+        if e.response.status_code == 404:
+            return False
+        raise  # Auth or network errors must not look like a missing part
+
+
+source_path = Path("path/to/behavior_test.csv")
+with tempfile.TemporaryDirectory() as parts_dir:
+    parts = iter_csv_parts(str(source_path), 10_000, parts_dir)
+    for part_number, part_path in parts:
+        # Names derived from the source file stay the same between runs,
+        # so a re-run finds and skips the parts that were already uploaded
+        part_name = f"{source_path.stem}-part-{part_number:04d}"
+        if part_exists(part_name):
+            continue
+        galtea.tests.create(
+            name=part_name,
+            type="BEHAVIOR",
+            product_id=product_id,
+            test_file_path=str(part_path),
+        )
+# @end large_test_file_in_parts
+
 # Cleanup
 galtea.products.delete(product_id=product_id)
@@ -4,6 +4,11 @@ Demonstrates trace decorator, start_trace, and context management patterns.
 These examples are referenced from the trace documentation pages.
 """
 
+import asyncio
+import contextvars
+import os
+import timeit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from galtea import (
@@ -230,6 +235,47 @@ inference_result_data = galtea.inference_results.generate(
 # @end trace_decorator_serialization
 
 
+def vector_search(query: str) -> list[dict]:
+    return [
+        {"id": f"doc_{i}", "content": "Long document text... " * 500} for i in range(5)
+    ]
+
+
+# @start trace_decorator_large_payloads
+def retrieve_documents(query: str) -> list[dict]:
+    # Record a compact summary instead of letting the full documents be serialized
+    with start_trace(
+        "retrieve_documents", type=TraceType.RETRIEVER, input={"query": query}
+    ) as span:
+        documents = vector_search(query)
+        span.update(
+            output=[
+                {"id": doc["id"], "preview": doc["content"][:200]} for doc in documents
+            ],
+            metadata={"doc_count": len(documents)},
+        )
+    return documents
+
+
+@trace(type=TraceType.GENERATION, log_args=False)
+def answer(query: str, documents: list[dict]) -> str:
+    # log_args=False skips serializing the (large) documents argument
+    return f"Answer based on {len(documents)} documents"
+
+
+def rag_agent(input_data: AgentInput) -> AgentResponse:
+    query = input_data.last_user_message_str() or ""
+    return AgentResponse(content=answer(query, retrieve_documents(query)))
+
+
+inference_result_rag = galtea.inference_results.generate(
+    agent=rag_agent,
+    session=session_serialization,
+    input="What is the refund policy?",
+)
+# @end trace_decorator_large_payloads
+
+
 # @start trace_decorator_context_propagation
 @trace(type=TraceType.AGENT)
 def agent_workflow() -> str:
@@ -260,6 +306,129 @@ finally:
 # @end trace_decorator_context_propagation
 
 
+# @start trace_decorator_disable
+# Turn tracing off for a whole process (e.g. batch jobs or unit tests) by
+# applying @trace only when it is enabled
+TRACING_ENABLED = os.environ.get("MY_APP_TRACING", "true") == "true"
+
+
+def traced(**options):
+    if TRACING_ENABLED:
+        return trace(**options)
+    return lambda function: function  # Plain function, no tracing overhead
+
+
+@traced(type=TraceType.TOOL)
+def lookup_price(product_id: str) -> float:
+    return 9.99
+
+
+# Measure the per-call overhead of @trace in your own environment
+def plain_lookup_price(product_id: str) -> float:
+    return 9.99
+
+
+traced_lookup_price = trace(type=TraceType.TOOL)(plain_lookup_price)
+
+
+def overhead_per_call(calls: int) -> float:
+    plain = timeit.timeit(lambda: plain_lookup_price("sku_1"), number=calls)
+    traced = timeit.timeit(lambda: traced_lookup_price("sku_1"), number=calls)
+    return (traced - plain) / calls * 1e6
+
+
+# Without an active context (e.g. code paths that are not being evaluated)
+print(f"@trace overhead (inactive context): {overhead_per_call(10_000):.1f} µs/call")
+
+# With an active context every call records a span that is sent to Galtea, so
+# use a throwaway session and stay below the batch processor's batch size
+benchmark_session = galtea.sessions.create(version_id=version_id, is_production=True)
+benchmark_inference_result = galtea.inference_results.create(
+    session_id=benchmark_session.id, input="Benchmark"
+)
+token = set_context(inference_result_id=benchmark_inference_result.id)
+try:
+    active_overhead = overhead_per_call(200)
+finally:
+    clear_context(token)
+print(f"@trace overhead (active context): {active_overhead:.1f} µs/call")
+# @end trace_decorator_disable
+
+
+# @start trace_context_concurrency
+INDEXES = ["faq", "policies", "products"]
+
+
+@trace(type=TraceType.RETRIEVER)
+def search_index(index_name: str, query: str) -> list[str]:
+    return [f"{index_name} result for {query}"]
+
+
+@trace(type=TraceType.AGENT)
+def fan_out_retrieval(query: str) -> list[str]:
+    with ThreadPoolExecutor(max_workers=len(INDEXES)) as executor:
+        # Pool threads do not inherit the caller's context, so run each call
+        # in a copy of it to keep the spans linked to the inference result
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, search_index, index_name, query
+            )
+            for index_name in INDEXES
+        ]
+        return [document for future in futures for document in future.result()]
+
+
+async def fan_out_retrieval_async(query: str) -> list[str]:
+    # asyncio tasks and asyncio.to_thread copy the current context themselves
+    results = await asyncio.gather(
+        *(asyncio.to_thread(search_index, index_name, query) for index_name in INDEXES)
+    )
+    return [document for documents in results for document in documents]
+
+
+inference_result_fan_out = galtea.inference_results.create(
+    session_id=session.id,
+    input="Where is my order?",
+)
+if inference_result_fan_out is None:
+    raise ValueError("inference_result_fan_out is None")
+
+token = set_context(inference_result_id=inference_result_fan_out.id)
+try:
+    documents = fan_out_retrieval("Where is my order?")
+    documents += asyncio.run(fan_out_retrieval_async("Where is my order?"))
+finally:
+    clear_context(token)
+# @end trace_context_concurrency
+
+
+# @start trace_context_process_pool
+def init_trace_worker() -> None:
+    # Runs once in each child process. Without its own client, the child's
+    # traces are never exported
+    global galtea
+    galtea = Galtea(api_key="YOUR_API_KEY")
+
+
+def search_index_in_process(
+    inference_result_id: str, index_name: str, query: str
+) -> list[str]:
+    token = set_context(inference_result_id=inference_result_id)
+    try:
+        return search_index(index_name, query)
+    finally:
+        clear_context(token)  # Exports the traces recorded in this process
+
+
+# with ProcessPoolExecutor(initializer=init_trace_worker) as executor:
+#     futures = [
+#         executor.submit(search_index_in_process, inference_result_id, name, query)
+#         for name in INDEXES
+#     ]
+#     documents = [document for future in futures for document in future.result()]
+# @end trace_context_process_pool
+
+
 # =============================================================================
 # CLEANUP
 # =============================================================================
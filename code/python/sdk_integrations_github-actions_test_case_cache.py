@@ -0,0 +1,99 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from _test_helpers import create_test_product
+from galtea import Galtea
+
+galtea = Galtea(api_key="YOUR_API_KEY")
+
+run_identifier: str = datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+PRODUCT_ID: str = create_test_product(
+    galtea,
+    name=f"docs-github-actions-cache-product-{run_identifier}",
+    description="Product for GitHub Actions test case cache documentation",
+)
+
+test = galtea.tests.create(
+    product_id=PRODUCT_ID,
+    name=f"github-actions-cache-test-{run_identifier}",
+    type="ACCURACY",
+    test_file_path="path/to/accuracy_test.csv",
+)
+
+
+# @start sync_test_cases
+def sync_test_cases(
+    test_id: str, db_path: str, page_size: int = 500, full_refresh: bool = False
+) -> sqlite3.Connection:
+    """Mirror a test's test cases into SQLite, fetching only the new ones.
+
+    With full_refresh=True every test case is downloaded again, so edited test
+    cases are updated and deleted ones are removed from the mirror.
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(db_path)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS test_cases (id TEXT PRIMARY KEY, test_id TEXT,"
+        " variant TEXT, strategy TEXT, language TEXT, data TEXT)"
+    )
+    for column in ("variant", "strategy", "language"):
+        db.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{column} ON test_cases (test_id, {column})"
+        )
+
+    # Test cases are listed oldest first, so the ones already stored are
+    # skipped with an offset and only newer test cases are downloaded
+    (offset,) = db.execute(
+        "SELECT COUNT(*) FROM test_cases WHERE test_id = ?", (test_id,)
+    ).fetchone()
+    if full_refresh:
+        offset = 0
+        db.execute("CREATE TEMP TABLE IF NOT EXISTS seen_ids (id TEXT PRIMARY KEY)")
+        db.execute("DELETE FROM seen_ids")
+    while True:
+        page = galtea.test_cases.list(
+            test_id=test_id, sort_by_created_at="asc", offset=offset, limit=page_size
+        )
+        for test_case in page:
+            data = vars(test_case)
+            db.execute(
+                "INSERT OR REPLACE INTO test_cases VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    test_case.id,
+                    test_id,
+                    data.get("variant"),
+                    data.get("strategy"),
+                    data.get("language"),
+                    json.dumps(data, default=str),
+                ),
+            )
+            if full_refresh:
+                db.execute("INSERT OR IGNORE INTO seen_ids VALUES (?)", (test_case.id,))
+        if len(page) < page_size:
+            if full_refresh:
+                db.execute(
+                    "DELETE FROM test_cases WHERE test_id = ?"
+                    " AND id NOT IN (SELECT id FROM seen_ids)",
+                    (test_id,),
+                )
+            db.commit()
+            return db
+        db.commit()
+        offset += len(page)
+
+
+# Pass full_refresh=True, e.g. in a scheduled nightly run, to pick up edits
+db = sync_test_cases(test.id, db_path=".galtea/test_cases.db")
+rows = db.execute(
+    "SELECT id, data FROM test_cases WHERE test_id = ? AND variant = ?",
+    (test.id, "original"),
+).fetchall()
+print(f"{len(rows)} cached test cases with the 'original' variant")
+# @end sync_test_cases
+
+# Cleanup
+db.close()
+galtea.products.delete(product_id=PRODUCT_ID)
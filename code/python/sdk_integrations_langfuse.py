@@ -241,6 +241,28 @@ handler.set_inference_result_id("inferenceResult_abc123")
 # Context is automatically cleared when the chain finishes.
 # @end callback_handler_singleton
 
+# @start callback_handler_per_thread
+import threading
+
+from galtea.integrations.langfuse import CallbackHandler
+
+_handlers = threading.local()
+
+
+def get_handler() -> CallbackHandler:
+    # One handler per worker thread: reused across that thread's requests,
+    # never shared between requests running at the same time
+    if not hasattr(_handlers, "handler"):
+        _handlers.handler = CallbackHandler()
+    return _handlers.handler
+
+
+# Per request:
+handler = get_handler()
+handler.set_inference_result_id("inferenceResult_abc123")
+# chain.invoke({"input": "query"}, config={"callbacks": [handler]})
+# @end callback_handler_per_thread
+
 # @start api_callback_handler_example
 from galtea.integrations.langfuse import CallbackHandler
 
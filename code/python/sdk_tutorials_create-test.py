@@ -3,6 +3,7 @@ Tutorial: Create a Custom Test
 Demonstrates how to create and upload custom tests using the SDK.
 """
 
+import csv
 from datetime import datetime
 
 from galtea import Galtea
@@ -17,6 +18,78 @@ galtea = Galtea(api_key="YOUR_API_KEY")
 product_id = create_test_product(galtea, name="Test Creation Demo " + run_identifier)
 
 
+# @start validate_test_file
+REQUIRED_COLUMNS = {
+    "ACCURACY": ["input"],
+    "SECURITY": ["input"],
+    "BEHAVIOR": ["goal", "user_persona"],
+}
+INTEGER_COLUMNS = ["instance_id", "max_iterations"]
+# Only original, role_play, base64, written and spoken appear verbatim in the
+# docs; the other identifiers follow the Security Strategies page naming
+ALLOWED_STRATEGIES = {
+    "SECURITY": {
+        "original",
+        "base64",
+        "hex",
+        "homoglyph",
+        "leetspeak",
+        "morse_code",
+        "rot13",
+        "zero_width_insertion",
+        "emoji_obfuscation",
+        "biblical",
+        "math_prompt",
+        "role_play",
+        "prefix",
+        "persuasive_content",
+        "creative_writing",
+        "data_analysis",
+        "bait_and_switch",
+        "empathetic_framing",
+    },
+    "BEHAVIOR": {"written", "spoken"},
+}
+
+
+def validate_test_file(path: str, test_type: str) -> list[str]:
+    """Check a test CSV in a single streaming pass and return every error found."""
+    errors = []
+    seen_instance_ids = set()
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        columns = reader.fieldnames or []
+        required = REQUIRED_COLUMNS[test_type]
+        missing = [column for column in required if column not in columns]
+        if missing:
+            return [f"Missing required columns: {', '.join(missing)}"]
+        for row in reader:
+            line = reader.line_num
+            for column in required:
+                if not (row[column] or "").strip():
+                    errors.append(f"Line {line}: '{column}' is empty")
+            for column in INTEGER_COLUMNS:
+                value = (row.get(column) or "").strip()
+                if value and not value.isdigit():
+                    errors.append(f"Line {line}: '{column}' is not an integer")
+            strategy = (row.get("strategy") or "").strip()
+            allowed_strategies = ALLOWED_STRATEGIES.get(test_type)
+            if strategy and allowed_strategies and strategy not in allowed_strategies:
+                errors.append(f"Line {line}: unknown strategy '{strategy}'")
+            instance_id = (row.get("instance_id") or "").strip()
+            if instance_id in seen_instance_ids:
+                errors.append(f"Line {line}: duplicate instance_id {instance_id}")
+            elif instance_id:
+                seen_instance_ids.add(instance_id)
+    return errors
+
+
+errors = validate_test_file("path/to/accuracy_test.csv", "ACCURACY")
+if errors:
+    raise ValueError("Invalid test file:\n" + "\n".join(errors))
+# @end validate_test_file
+
+
 # @start upload_existing_test
 # Upload a pre-existing test file to the Galtea Platform
 test = galtea.tests.create(
@@ -3,7 +3,17 @@ Tutorial: Monitor Production Responses
 Demonstrates how to log and evaluate user queries from your production environment.
 """
 
+import asyncio
+import atexit
+import functools
+import itertools
+import json
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 
 from _test_helpers import create_test_product
 from galtea import Galtea
@@ -67,6 +77,194 @@ handle_user_query(
 # @end single_turn
 
 
+# @start async_handler
+# In an async request handler (e.g. FastAPI)...
+async def handle_user_query_async(
+    user_query: str, retrieval_context: str | None = None
+) -> str:
+    model_response = your_product_function(user_query, retrieval_context)
+
+    def log_interaction() -> None:
+        session = galtea.sessions.create(version_id=VERSION_ID, is_production=True)
+        galtea.inference_results.create_and_evaluate(
+            session_id=session.id,
+            input=user_query,
+            output=model_response,
+            retrieval_context=retrieval_context,
+            metrics=[{"name": "Answer Relevancy"}],
+        )
+
+    # The Galtea client is synchronous: run it in a worker thread so the
+    # event loop keeps serving other requests while the calls are in flight
+    await asyncio.to_thread(log_interaction)
+
+    return model_response
+
+
+asyncio.run(
+    handle_user_query_async(
+        "What are your business hours?", "Business hours: 9am-5pm Monday-Friday"
+    )
+)
+# @end async_handler
+
+
+# @start background_logging
+# Bounded queue so a slow or unavailable API can never grow memory unboundedly
+log_queue: queue.Queue = queue.Queue(maxsize=1000)
+
+
+LOG_FLUSH_TIMEOUT = 10.0  # Max seconds spent sending queued logs at exit
+STOP_WORKER = object()
+
+
+def on_log_failure(interaction: dict, error: Exception) -> None:
+    print(f"Failed to log interaction to Galtea: {error}")
+
+
+def galtea_log_worker() -> None:
+    while True:
+        interaction = log_queue.get()
+        if interaction is STOP_WORKER:
+            log_queue.task_done()
+            return
+        try:
+            session = galtea.sessions.create(version_id=VERSION_ID, is_production=True)
+            galtea.inference_results.create_and_evaluate(
+                session_id=session.id,
+                metrics=[{"name": "Answer Relevancy"}],
+                **interaction,
+            )
+        except Exception as e:
+            on_log_failure(interaction, e)
+        finally:
+            log_queue.task_done()
+
+
+def flush_log_queue(timeout: float = LOG_FLUSH_TIMEOUT) -> None:
+    """Send the interactions still queued at exit, but never wait past `timeout`."""
+    deadline = time.monotonic() + timeout
+    try:
+        log_queue.put(STOP_WORKER, timeout=timeout)
+    except queue.Full:
+        return
+    log_worker.join(timeout=max(0.0, deadline - time.monotonic()))
+
+
+log_worker = threading.Thread(target=galtea_log_worker, daemon=True)
+log_worker.start()
+atexit.register(flush_log_queue)
+
+
+def handle_user_query_in_background(
+    user_query: str, retrieval_context: str | None = None
+) -> str:
+    model_response = your_product_function(user_query, retrieval_context)
+
+    try:
+        log_queue.put_nowait(
+            {
+                "input": user_query,
+                "output": model_response,
+                "retrieval_context": retrieval_context,
+            }
+        )
+    except queue.Full:
+        # Drop the log entry rather than delay the user's response
+        print("Galtea log queue is full, dropping interaction")
+
+    return model_response
+
+
+handle_user_query_in_background(
+    "What are your business hours?", "Business hours: 9am-5pm Monday-Friday"
+)
+# @end background_logging
+
+# Wait for the queued interaction to be logged before continuing the demo
+log_queue.join()
+
+
+# @start spool_failed_logs
+SPOOL_DIRECTORY = Path("./galtea_spool")
+SPOOL_MAX_FILES = 10_000  # The oldest interactions are dropped beyond this
+spool_writes = itertools.count(1)
+
+
+def enforce_spool_cap(spooled: list[Path]) -> list[Path]:
+    """Delete the oldest files beyond SPOOL_MAX_FILES and return the rest."""
+    if len(spooled) <= SPOOL_MAX_FILES:
+        return spooled
+    # Evict an extra tenth so the cap is not hit again on the next write
+    excess = len(spooled) - SPOOL_MAX_FILES + SPOOL_MAX_FILES // 10
+    for old_path in spooled[:excess]:
+        old_path.unlink(missing_ok=True)
+    return spooled[excess:]
+
+
+def spool_interaction(interaction: dict) -> None:
+    """Save an interaction that could not be logged so it survives restarts."""
+    SPOOL_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    # Nanosecond timestamps keep the files in the order they were spooled
+    path = SPOOL_DIRECTORY / f"{time.time_ns()}.json"
+    temporary_path = path.with_suffix(".tmp")
+    temporary_path.write_text(json.dumps(interaction))
+    temporary_path.replace(path)  # Atomic, so a crash never leaves half a file
+
+    # Listing a large directory is costly, so only check the cap every 100
+    # writes here; replay_spool_once() also checks it, including at startup
+    if next(spool_writes) % 100 == 0:
+        enforce_spool_cap(sorted(SPOOL_DIRECTORY.glob("*.json")))
+
+
+# Replaces the handler called by galtea_log_worker above
+def on_log_failure(interaction: dict, error: Exception) -> None:  # noqa: F811
+    print(f"Failed to log interaction to Galtea, spooling it: {error}")
+    spool_interaction(interaction)
+
+
+def replay_spool_once() -> bool:
+    """Send spooled interactions oldest first. Returns False if the API failed."""
+    for path in enforce_spool_cap(sorted(SPOOL_DIRECTORY.glob("*.json"))):
+        try:
+            interaction = json.loads(path.read_text())
+        except FileNotFoundError:
+            continue  # Evicted by spool_interaction in the meantime
+        try:
+            session = galtea.sessions.create(version_id=VERSION_ID, is_production=True)
+            galtea.inference_results.create_and_evaluate(
+                session_id=session.id,
+                metrics=[{"name": "Answer Relevancy"}],
+                **interaction,
+            )
+        except Exception as e:
+            print(f"Galtea unavailable, keeping spooled interactions: {e}")
+            return False
+        path.unlink(missing_ok=True)
+    return True
+
+
+def replay_spool() -> None:
+    """Replay the spool forever, backing off while the API is down."""
+    delay = 1.0
+    while True:
+        if replay_spool_once():
+            delay = 1.0
+            time.sleep(10)
+        else:
+            time.sleep(delay)
+            delay = min(delay * 2, 300)
+
+
+# In production, start replaying at startup and keep it running:
+# threading.Thread(target=replay_spool, daemon=True).start()
+# Here, replay whatever a previous run left in the spool once
+replay_spool_once()
+# @end spool_failed_logs
+
+shutil.rmtree(SPOOL_DIRECTORY, ignore_errors=True)
+
+
 METRICS_TO_EVALUATE = [
     {"name": "Conversation Relevancy"},
     {"name": "Knowledge Retention"},
@@ -109,6 +307,30 @@ for question in user_questions:
 # @end log_turns_individually
 
 
+# @start reuse_session
+@functools.lru_cache(maxsize=10_000)
+def get_galtea_session_id(conversation_id: str) -> str:
+    # Resolved once per conversation; later turns reuse the cached session ID
+    session = galtea.sessions.get_or_create(
+        custom_id=conversation_id, version_id=VERSION_ID, is_production=True
+    )
+    return session.id
+
+
+def log_turn(conversation_id: str, user_input: str, model_output: str) -> None:
+    galtea.inference_results.create(
+        session_id=get_galtea_session_id(conversation_id),
+        input=user_input,
+        output=model_output,
+    )
+
+
+conversation_id = "CLIENT_CONVERSATION_ID"
+for question in ["Do you ship abroad?", "How long does it take?"]:
+    log_turn(conversation_id, question, get_model_response(question))
+# @end reuse_session
+
+
 # Create a new session for batch logging
 session_batch = galtea.sessions.create(
     version_id=VERSION_ID,
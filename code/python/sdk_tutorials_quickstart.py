@@ -1,7 +1,6 @@
-import time
 from datetime import datetime
 
-from _test_helpers import create_test_product
+from _test_helpers import create_test_product, wait_for_tests_ready
 from requests.exceptions import HTTPError
 
 from galtea import (
@@ -116,36 +115,11 @@ if test is None:
     raise ValueError("Failed to create behavior test")
 behavior_test = test
 
-max_wait_iterations = 120  # e.g., wait up to 2 minutes
-for _ in range(max_wait_iterations):
-    # Pick the first test that has a URI
-    test = galtea.tests.get(test_id=accuracy_test.id)
-    if test.uri:
-        break
-    print("Waiting for accuracy test file to be ready...")
-    time.sleep(1)
-else:
-    raise ValueError("Test file URI is still None after waiting. Test id: " + test.id)
-
-max_wait_iterations = 120  # e.g., wait up to 2 minutes
-for _ in range(max_wait_iterations):
-    test = galtea.tests.get(test_id=security_test.id)
-    if test.uri:
-        break
-    print("Waiting for security test file to be ready...")
-    time.sleep(1)
-else:
-    raise ValueError("Test file URI is still None after waiting. Test id: " + test.id)
-
-max_wait_iterations = 120  # e.g., wait up to 2 minutes
-for _ in range(max_wait_iterations):
-    test = galtea.tests.get(test_id=behavior_test.id)
-    if test.uri:
-        break
-    print("Waiting for behavior test file to be ready...")
-    time.sleep(1)
-else:
-    raise ValueError("Test file URI is still None after waiting. Test id: " + test.id)
+# Wait for all three tests concurrently instead of one after another
+ready_tests = wait_for_tests_ready(
+    galtea, [accuracy_test.id, security_test.id, behavior_test.id]
+)
+test = ready_tests[behavior_test.id]
 
 # Ensure it works with all test types, then do the actual demo code
 test_cases = galtea.test_cases.list(test_id=accuracy_test.id)
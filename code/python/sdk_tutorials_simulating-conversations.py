@@ -3,13 +3,13 @@ Tutorial: Simulating User Conversations
 Demonstrates how to use Galtea's Conversation Simulator to test your AI with a synthetic user.
 """
 
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 import galtea
 from galtea import Galtea
 
-from _test_helpers import create_test_product
+from _test_helpers import create_test_product, wait_for_tests_ready
 
 run_identifier = datetime.now().strftime("%Y%m%d%H%M%S")
 
@@ -34,15 +34,8 @@ test = galtea_client.tests.create(
     language="english",
     max_test_cases=1,
 )
-test_cases = []
-tries = 0
-while len(test_cases) == 0:
-    test_cases = galtea_client.test_cases.list(test_id=test.id)
-    tries += 1
-    time.sleep(1)
-    print("Waiting for test cases to be generated...")
-    if tries > 30:
-        raise ValueError("No test cases found after multiple tries")
+wait_for_tests_ready(galtea_client, [test.id], require_test_cases=True, timeout=30)
+test_cases = galtea_client.test_cases.list(test_id=test.id)
 test_case_id = test_cases[0].id
 session_id = galtea_client.sessions.create(
     version_id=version_id, test_case_id=test_case_id
@@ -199,6 +192,34 @@ for test_case in test_cases:
 # @end evaluate_session
 
 
+# @start run_simulations_in_parallel
+# Simulate and evaluate one test case end to end
+def simulate_and_evaluate(test_case):
+    session = galtea_client.sessions.create(
+        version_id=version.id, test_case_id=test_case.id
+    )
+    result = galtea_client.simulator.simulate(
+        session_id=session.id, agent=my_agent, max_turns=10
+    )
+    galtea_client.evaluations.create(
+        session_id=session.id, metrics=[{"name": "Role Adherence"}]
+    )
+    return test_case, result
+
+
+# Run up to 8 conversations at a time and handle each one as soon as it finishes
+with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = [executor.submit(simulate_and_evaluate, tc) for tc in test_cases]
+    for future in as_completed(futures):
+        try:
+            test_case, result = future.result()
+        except Exception as e:
+            print(f"Simulation failed: {e}")
+            continue
+        print(f"{test_case.scenario}: {result.total_turns} turns")
+# @end run_simulations_in_parallel
+
+
 # @start rag_agent
 def my_rag_agent(input_data: galtea.AgentInput) -> galtea.AgentResponse:
     user_message = input_data.last_user_message_str()
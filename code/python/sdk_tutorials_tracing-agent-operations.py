@@ -3,6 +3,8 @@ Tutorial: Tracing Agent Operations
 Demonstrates how to trace agent operations using the SDK.
 """
 
+import random
+import time
 from datetime import datetime
 
 from galtea import (
@@ -171,6 +173,38 @@ finally:
     clear_context(token)  # flush=True by default
 # @end 3_collect_and_send_traces_to_galtea
 
+# @start sampling_traces
+TRACE_SAMPLE_RATE = 0.1  # Keep traces for 10% of ordinary requests
+SLOW_REQUEST_SECONDS = 2.0  # Always keep traces for slower requests
+
+
+def handle_traced_request(session_id: str, user_input: str) -> str:
+    inference_result = galtea.inference_results.create(
+        session_id=session_id, input=user_input, output=None
+    )
+    token = set_context(inference_result_id=inference_result.id)
+    start = time.perf_counter()
+    failed = False
+    try:
+        response = run_agent(user_input)
+        galtea.inference_results.update(
+            inference_result_id=inference_result.id, output=response
+        )
+        return response
+    except Exception:
+        failed = True
+        raise
+    finally:
+        # Decide once per inference result. This only applies to traces still
+        # pending here: the batch processor may already have exported some
+        slow = time.perf_counter() - start > SLOW_REQUEST_SECONDS
+        keep = failed or slow or random.random() < TRACE_SAMPLE_RATE
+        clear_context(token, flush=keep)
+
+
+handle_traced_request(manual_session.id, "What's the price?")
+# @end sampling_traces
+
 # @start remote_agent_tracing
 import httpx
 
@@ -211,6 +245,48 @@ def handle_request(message: str, session_id: str, inference_result_id: str) -> s
 # @end remote_server_handler
 
 
+# @start remote_context_middleware
+# Client side: send the ID as a header instead of in each request body
+http_client = httpx.Client(base_url="https://my-remote-agent.example.com")
+
+
+@trace(type=TraceType.AGENT)
+def remote_agent_with_header(input_data: AgentInput) -> AgentResponse:
+    response = http_client.post(
+        "/invoke",
+        json={"message": input_data.last_user_message_str()},
+        headers={"X-Galtea-Inference-Id": input_data.inference_result_id or ""},
+    )
+    return AgentResponse(content=response.json()["content"])
+
+
+# Server side: ASGI middleware (FastAPI, Starlette, ...) that links every
+# request carrying the header to its inference result
+class GalteaContextMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        headers = dict(scope.get("headers", []))
+        inference_result_id = headers.get(b"x-galtea-inference-id")
+        if scope["type"] != "http" or not inference_result_id:
+            await self.app(scope, receive, send)
+            return
+
+        token = set_context(inference_result_id=inference_result_id.decode())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Flushes the request's traces synchronously on the event loop. It
+            # must run here: the token cannot be reset from a worker thread
+            clear_context(token)
+
+
+# app = FastAPI()
+# app.add_middleware(GalteaContextMiddleware)
+# @end remote_context_middleware
+
+
 def run_agent_logic(message: str) -> str:
     return "Response to: " + message
 
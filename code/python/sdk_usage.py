@@ -3,6 +3,10 @@ SDK Usage Examples
 Demonstrates common SDK usage patterns.
 """
 
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from _test_helpers import create_test_product
@@ -139,6 +143,110 @@ def fetch_all_test_cases(test_id: str, limit: int = 100) -> list:
     return all_test_cases
 
 
+# @start working_with_pagination_lazy
+
+
+# Lazily iterate over any list method, fetching the next page in the background
+def iter_all(
+    list_method: Callable[..., list], page_size: int = 100, **filters
+) -> Iterator:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offset = 0
+        next_page = executor.submit(
+            list_method, offset=offset, limit=page_size, **filters
+        )
+        while True:
+            page = next_page.result()
+            if len(page) == page_size:
+                offset += page_size
+                next_page = executor.submit(
+                    list_method, offset=offset, limit=page_size, **filters
+                )
+            yield from page
+            if len(page) < page_size:
+                break
+
+
+for evaluation in iter_all(galtea.evaluations.list, version_id=version.id):
+    # Processing starts as soon as the first page arrives
+    print(f"Evaluation ID: {evaluation.id}, Score: {evaluation.score}")
+# @end working_with_pagination_lazy
+
+# @start fetching_many_by_id
+
+
+# Fetch many objects by ID with one request per chunk instead of one per ID
+def get_many(
+    list_method: Callable[..., list], ids: list[str], chunk_size: int = 100, **filters
+) -> dict:
+    objects_by_id = {}
+    unique_ids = list(dict.fromkeys(ids))
+    for start in range(0, len(unique_ids), chunk_size):
+        chunk = unique_ids[start : start + chunk_size]
+        for obj in list_method(id=chunk, limit=len(chunk), **filters):
+            objects_by_id[obj.id] = obj
+    return objects_by_id
+
+
+version_evaluations = galtea.evaluations.list(version_id=version.id)
+metrics_by_id = get_many(
+    galtea.metrics.list,
+    [e.metric_id for e in version_evaluations],
+    include_legacy=True,  # Evaluations may reference deprecated metrics
+)
+sessions_by_id = get_many(
+    galtea.sessions.list, [e.session_id for e in version_evaluations]
+)
+# @end fetching_many_by_id
+
+# @start caching_lookups
+
+
+# Cache repeated get()/get_by_name() lookups for a few minutes
+class LookupCache:
+    def __init__(self, ttl: float = 300, max_size: int = 1000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, method: Callable, **kwargs):
+        key = (method.__qualname__, tuple(sorted(kwargs.items())))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = method(**kwargs)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)  # Evict the least recently used
+        return value
+
+    def invalidate(self, object_id: str) -> None:
+        """Drop every cached lookup that returned the object with this ID."""
+        for key, (_, value) in list(self._entries.items()):
+            if getattr(value, "id", None) == object_id:
+                del self._entries[key]
+
+
+lookups = LookupCache(ttl=300)
+for evaluation in version_evaluations:
+    metric = lookups.get(galtea.metrics.get, metric_id=evaluation.metric_id)
+cached_test = lookups.get(
+    galtea.tests.get_by_name, product_id=product.id, test_name=test.name
+)
+
+# Your own updates and deletes must invalidate the cached object
+galtea.tests.update(test_id=cached_test.id, metadata={"owner": "docs-team"})
+lookups.invalidate(cached_test.id)
+print(f"Lookup cache: {lookups.hits} hits, {lookups.misses} misses")
+# @end caching_lookups
+
+
 # @start working_with_pagination_understanding
 
 # Products/pages examples